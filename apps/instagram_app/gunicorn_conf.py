@@ -0,0 +1,17 @@
+# instagram_app/gunicorn_conf.py
+# Launch with: gunicorn main:app -c gunicorn_conf.py  (from apps/instagram_app)
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Routes are I/O-bound, so run (2 x cores) + 1 Uvicorn workers; WEB_CONCURRENCY overrides.
+# cpu_count() sees host CPUs inside containers, and each worker owns its own DB pools
+# (shared/database.py, 10 connections max per pool), so cap the default at 4 workers to
+# keep 4 x (central + app pool) = 80 connections under Postgres's max_connections=100.
+MAX_DEFAULT_WORKERS = 4
+workers = int(os.getenv("WEB_CONCURRENCY",
+                        min(MAX_DEFAULT_WORKERS, max(2, (multiprocessing.cpu_count() or 1) * 2 + 1))))
+# UvicornWorker picks up uvloop/httptools automatically when they are installed.
+worker_class = "uvicorn_worker.UvicornWorker"
+keepalive = 5
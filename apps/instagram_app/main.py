@@ -1,4 +1,5 @@
 # instagram_app/main.py
+import os
 from fastapi import FastAPI
 from api.routes import user_routes, post_routes, analytics_routes, ml_routes, evasion_routes
 
@@ -9,6 +10,11 @@ app.include_router(analytics_routes.router, prefix="/analytics")
 app.include_router(ml_routes.router, prefix="/ml")
 app.include_router(evasion_routes.router, prefix="/evasion")
 
+# Production: gunicorn main:app -c gunicorn_conf.py
+# Local dev: python main.py; both must run from apps/instagram_app, since the
+# "main:app" import string (needed for workers=) resolves relative to it.
 if __name__ == "__main__":
+    # "auto" selects uvloop/httptools when installed.
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="auto", http="auto",
+                workers=int(os.getenv("WEB_CONCURRENCY", "1")))
\ No newline at end of file
@@ -0,0 +1,2 @@
+# SocialSense/conftest.py
+# Puts the repo root on sys.path so tests can import `shared` from any working directory.
@@ -1,65 +1,119 @@
 # SocialSense/shared/database.py
 import psycopg2
 from psycopg2 import pool
+from psycopg2.extras import execute_values
+import logging
 import os
+import threading
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env
 
-class Database:
-    _central_pool = None
-    _app_pools = {}
+logger = logging.getLogger(__name__)
+
+# Pool bounds are per process: under Gunicorn every worker holds its own pools,
+# so keep workers * *_DB_MAX_CONN below the server's max_connections.
+# Pools live at module level so the connection getters can hit them directly
+_central_pool = None
+_app_pools = {}
+_pool_lock = threading.Lock()  # Serializes first-use pool creation across threads
 
+class Database:
     @staticmethod
-    def init_central_db(min_conn=1, max_conn=10):
+    def init_central_db(min_conn=None, max_conn=None):
         """Initialize connection pool for the centralized database."""
-        if not Database._central_pool:
-            Database._central_pool = psycopg2.pool.SimpleConnectionPool(
-                min_conn,
-                max_conn,
-                database=os.getenv("CENTRAL_DB_NAME", "socialsense_central"),
-                user=os.getenv("CENTRAL_DB_USER", "user"),
-                password=os.getenv("CENTRAL_DB_PASSWORD", "password"),
-                host=os.getenv("CENTRAL_DB_HOST", "localhost"),
-                port=os.getenv("CENTRAL_DB_PORT", "5432")
-            )
-        return Database._central_pool
+        global _central_pool
+        if not _central_pool:
+            with _pool_lock:
+                if not _central_pool:
+                    if min_conn is None:
+                        min_conn = int(os.getenv("CENTRAL_DB_MIN_CONN", "1"))
+                    if max_conn is None:
+                        max_conn = int(os.getenv("CENTRAL_DB_MAX_CONN", "10"))
+                    _central_pool = psycopg2.pool.ThreadedConnectionPool(
+                        min_conn,
+                        max_conn,
+                        database=os.getenv("CENTRAL_DB_NAME", "socialsense_central"),
+                        user=os.getenv("CENTRAL_DB_USER", "user"),
+                        password=os.getenv("CENTRAL_DB_PASSWORD", "password"),
+                        host=os.getenv("CENTRAL_DB_HOST", "localhost"),
+                        port=os.getenv("CENTRAL_DB_PORT", "5432")
+                    )
+                    logger.info("Created central DB pool (min_conn=%d, max_conn=%d)", min_conn, max_conn)
+        return _central_pool
 
     @staticmethod
-    def init_app_db(app_name, min_conn=1, max_conn=10):
+    def init_app_db(app_name, min_conn=None, max_conn=None):
         """Initialize connection pool for an app-specific database."""
-        if app_name not in Database._app_pools:
-            env_prefix = f"{app_name.upper()}_DB_"
-            Database._app_pools[app_name] = psycopg2.pool.SimpleConnectionPool(
-                min_conn,
-                max_conn,
-                database=os.getenv(f"{env_prefix}NAME", f"{app_name}_db"),
-                user=os.getenv(f"{env_prefix}USER", "user"),
-                password=os.getenv(f"{env_prefix}PASSWORD", "password"),
-                host=os.getenv(f"{env_prefix}HOST", "localhost"),
-                port=os.getenv(f"{env_prefix}PORT", "5432")
-            )
-        return Database._app_pools[app_name]
+        if app_name not in _app_pools:
+            with _pool_lock:
+                if app_name not in _app_pools:
+                    env_prefix = f"{app_name.upper()}_DB_"
+                    if min_conn is None:
+                        min_conn = int(os.getenv(f"{env_prefix}MIN_CONN", "1"))
+                    if max_conn is None:
+                        max_conn = int(os.getenv(f"{env_prefix}MAX_CONN", "10"))
+                    _app_pools[app_name] = psycopg2.pool.ThreadedConnectionPool(
+                        min_conn,
+                        max_conn,
+                        database=os.getenv(f"{env_prefix}NAME", f"{app_name}_db"),
+                        user=os.getenv(f"{env_prefix}USER", "user"),
+                        password=os.getenv(f"{env_prefix}PASSWORD", "password"),
+                        host=os.getenv(f"{env_prefix}HOST", "localhost"),
+                        port=os.getenv(f"{env_prefix}PORT", "5432")
+                    )
+                    logger.info("Created %s DB pool (min_conn=%d, max_conn=%d)", app_name, min_conn, max_conn)
+        return _app_pools[app_name]
+
+    @staticmethod
+    def _pool(app_name=None):
+        """Return the app-specific pool (or the central one), creating it on first use."""
+        if app_name:
+            return _app_pools.get(app_name) or Database.init_app_db(app_name)
+        return _central_pool or Database.init_central_db()
 
     @staticmethod
     def get_central_connection():
         """Get a connection from the centralized database pool."""
-        pool = Database.init_central_db()
-        return pool.getconn()
+        return Database._pool().getconn()
 
     @staticmethod
     def get_app_connection(app_name):
         """Get a connection from an app-specific database pool."""
-        pool = Database.init_app_db(app_name)
-        return pool.getconn()
+        return Database._pool(app_name).getconn()
 
     @staticmethod
     def release_connection(conn, app_name=None):
         """Release a connection back to its pool."""
         if app_name:
-            Database._app_pools[app_name].putconn(conn)
+            _app_pools[app_name].putconn(conn)
         else:
-            Database._central_pool.putconn(conn)
+            _central_pool.putconn(conn)
+
+    @staticmethod
+    @contextmanager
+    def connection(app_name=None):
+        """Yield a pooled connection, committing on success and always returning it to the pool."""
+        db_pool = Database._pool(app_name)
+        conn = db_pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            # A dead connection can't roll back; let the caller's exception surface instead
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            db_pool.putconn(conn, close=bool(conn.closed))
+
+    @staticmethod
+    def batch_execute(sql, rows, app_name=None, page_size=1000):
+        """Run a single-``VALUES %s`` statement over rows, page_size rows per round trip."""
+        with Database.connection(app_name) as conn:
+            with conn.cursor() as cursor:
+                execute_values(cursor, sql, rows, page_size=page_size)
 
 # Example usage
 if __name__ == "__main__":
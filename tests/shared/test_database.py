@@ -0,0 +1,141 @@
+# SocialSense/tests/shared/test_database.py
+import logging
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from shared import database
+from shared.database import Database
+
+APP = "instagram_app"
+
+
+@pytest.fixture
+def db_pool(monkeypatch):
+    """Install a mock pool for APP whose getconn hands out one open connection."""
+    conn = mock.MagicMock(closed=0)
+    db_pool = mock.MagicMock()
+    db_pool.getconn.return_value = conn
+    monkeypatch.setattr(database, "_app_pools", {APP: db_pool})
+    return db_pool
+
+
+def test_connection_commits_and_returns_conn_on_success(db_pool):
+    conn = db_pool.getconn.return_value
+    with Database.connection(APP) as yielded:
+        assert yielded is conn
+    conn.commit.assert_called_once_with()
+    conn.rollback.assert_not_called()
+    db_pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_connection_rolls_back_and_reraises_on_error(db_pool):
+    conn = db_pool.getconn.return_value
+    with pytest.raises(ValueError):
+        with Database.connection(APP):
+            raise ValueError("boom")
+    conn.commit.assert_not_called()
+    conn.rollback.assert_called_once_with()
+    db_pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_connection_discards_dead_conn_without_masking_error(db_pool):
+    conn = db_pool.getconn.return_value
+    conn.rollback.side_effect = AssertionError("rollback on a closed connection")
+    with pytest.raises(ValueError):
+        with Database.connection(APP):
+            conn.closed = 2  # what psycopg2 reports after the server drops the link
+            raise ValueError("boom")
+    conn.rollback.assert_not_called()
+    db_pool.putconn.assert_called_once_with(conn, close=True)
+
+
+def test_batch_execute_pages_rows_through_execute_values(db_pool):
+    conn = db_pool.getconn.return_value
+    cursor = conn.cursor.return_value.__enter__.return_value
+    sql = "INSERT INTO users (username) VALUES %s"
+    rows = [("a",), ("b",), ("c",)]
+    with mock.patch.object(database, "execute_values") as execute_values:
+        Database.batch_execute(sql, rows, APP, page_size=2)
+    execute_values.assert_called_once_with(cursor, sql, rows, page_size=2)
+    conn.commit.assert_called_once_with()
+    db_pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_release_connection_returns_conn_to_existing_pool(db_pool):
+    conn = Database.get_app_connection(APP)
+    Database.release_connection(conn, APP)
+    db_pool.putconn.assert_called_once_with(conn)
+
+
+def test_release_connection_never_creates_a_pool(monkeypatch):
+    monkeypatch.setattr(database, "_app_pools", {})
+    with mock.patch.object(database.psycopg2.pool, "ThreadedConnectionPool") as pool_cls:
+        with pytest.raises(KeyError):
+            Database.release_connection(mock.MagicMock(), APP)
+    pool_cls.assert_not_called()
+    assert database._app_pools == {}
+
+
+@pytest.fixture
+def pool_cls(monkeypatch):
+    """Start with no pools and record ThreadedConnectionPool constructions."""
+    monkeypatch.setattr(database, "_central_pool", None)
+    monkeypatch.setattr(database, "_app_pools", {})
+    with mock.patch.object(database.psycopg2.pool, "ThreadedConnectionPool") as pool_cls:
+        yield pool_cls
+
+
+def test_pool_bounds_default_to_one_and_ten(pool_cls, monkeypatch):
+    for var in ("INSTAGRAM_APP_DB_MIN_CONN", "INSTAGRAM_APP_DB_MAX_CONN", "CENTRAL_DB_MIN_CONN", "CENTRAL_DB_MAX_CONN"):
+        monkeypatch.delenv(var, raising=False)
+    Database.init_app_db(APP)
+    Database.init_central_db()
+    assert [c.args for c in pool_cls.call_args_list] == [(1, 10), (1, 10)]
+
+
+def test_pool_bounds_come_from_env(pool_cls, monkeypatch):
+    monkeypatch.setenv("INSTAGRAM_APP_DB_MIN_CONN", "3")
+    monkeypatch.setenv("INSTAGRAM_APP_DB_MAX_CONN", "7")
+    monkeypatch.setenv("CENTRAL_DB_MIN_CONN", "2")
+    monkeypatch.setenv("CENTRAL_DB_MAX_CONN", "5")
+    Database.init_app_db(APP)
+    Database.init_central_db()
+    assert [c.args for c in pool_cls.call_args_list] == [(3, 7), (2, 5)]
+
+
+def test_explicit_zero_min_conn_is_respected(pool_cls, monkeypatch):
+    monkeypatch.setenv("INSTAGRAM_APP_DB_MIN_CONN", "3")
+    monkeypatch.setenv("CENTRAL_DB_MIN_CONN", "3")
+    Database.init_app_db(APP, min_conn=0, max_conn=5)
+    Database.init_central_db(min_conn=0, max_conn=5)
+    assert [c.args for c in pool_cls.call_args_list] == [(0, 5), (0, 5)]
+
+
+def test_pool_creation_logs_bounds_once(pool_cls, caplog):
+    with caplog.at_level(logging.INFO, logger=database.__name__):
+        Database.init_app_db(APP, min_conn=0, max_conn=5)
+        Database.init_app_db(APP)
+    assert [r.getMessage() for r in caplog.records] == ["Created instagram_app DB pool (min_conn=0, max_conn=5)"]
+
+
+def test_concurrent_first_use_builds_one_pool(pool_cls):
+    def slow_pool(*args, **kwargs):
+        time.sleep(0.05)  # widen the window between the existence check and the assignment
+        return mock.MagicMock()
+
+    pool_cls.side_effect = slow_pool
+    start = threading.Barrier(8)
+
+    def checkout():
+        start.wait()
+        Database.get_app_connection(APP)
+
+    threads = [threading.Thread(target=checkout) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert pool_cls.call_count == 1